@@ -11,13 +11,26 @@ import argparse
 import asyncio
 import csv
 import json
+import logging
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone as dt_timezone
 from typing import Optional
 from pytz import timezone
 
 import websockets
 
+from src.config import WS_COMPRESSION, WS_MAX_MESSAGE_BYTES
+from src.event_loop import run_async
+from src.logging_config import get_logger, setup_logging
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder
+    orjson = None
+
+logger = get_logger(__name__)
+
 # WebSocket endpoint for Polymarket CLOB
 # Update this URL based on Polymarket's actual WebSocket endpoint
 # Common patterns:
@@ -28,13 +41,72 @@ WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
 # Target price level to monitor
 TARGET_PRICE = 0.999
 
-# Price comparison tolerance for floating point comparison
-# Used when checking if a price matches TARGET_PRICE
-PRICE_TOLERANCE = 0.0001
+# Prices are compared as integer ticks of 0.0001 (the finest CLOB tick size)
+# instead of floats with a tolerance
+PRICE_DECIMALS = 4
+PRICE_TICKS_PER_UNIT = 10**PRICE_DECIMALS
+TARGET_PRICE_TICKS = round(TARGET_PRICE * PRICE_TICKS_PER_UNIT)
+
+# Price windows recorded for each side of the book, in ticks (inclusive)
+BID_MIN_TICKS = 9900  # Every bid at or above 0.99
+BID_MAX_TICKS = PRICE_TICKS_PER_UNIT - 1  # CLOB prices stay below 1.0, so 0.9999 is the top
+ASK_MIN_TICKS = TARGET_PRICE_TICKS  # Asks at exactly TARGET_PRICE; 0.9991 is not recorded
+ASK_MAX_TICKS = TARGET_PRICE_TICKS
+
+# Price string prefixes any level inside each window must start with. The
+# CLOB sends prices both as "0.999" and ".999", so both forms are accepted.
+BID_PRICE_PREFIXES = ("0.99", ".99")
+ASK_PRICE_PREFIXES = ("0.999", ".999")
+
+# Quoted event type every book frame contains ("event_type": "book"); text
+# frames arrive as str and binary frames as bytes, so both forms are kept
+BOOK_EVENT_MARKER = '"book"'
+BOOK_EVENT_MARKER_BYTES = b'"book"'
+
+# Frames waiting for the parser task; the oldest frame is dropped when full
+MESSAGE_QUEUE_SIZE = 4096
+# Dropped frames are counted and reported at most once per interval, so a
+# parser that falls behind is not slowed down further by per-frame warnings
+DROPPED_FRAMES_LOG_INTERVAL_SECONDS = 10.0
+
+# Reconnect backoff: starts at RECONNECT_DELAY_SECONDS and doubles per failed
+# attempt up to MAX_RECONNECT_DELAY_SECONDS, resetting once subscribed again
+RECONNECT_DELAY_SECONDS = 1
+MAX_RECONNECT_DELAY_SECONDS = 60
 
 # Separator line length for console output
 SEPARATOR_LENGTH = 60
 
+# Timezone for the timestamp_est column, resolved once at import time
+EST_TIMEZONE = timezone("US/Eastern")
+
+# Format of the timestamp_iso / timestamp_est columns (second resolution)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# CSV rows are buffered and written in batches instead of flushing per row
+CSV_FLUSH_INTERVAL_SECONDS = 0.5  # Maximum time a row waits in the buffer
+CSV_FLUSH_BATCH_SIZE = 100  # Flush immediately once this many rows are pending
+CSV_LINE_TERMINATOR = "\r\n"  # Same as csv.writer's default, which writes the header
+
+
+def price_to_ticks(price_str: str) -> int:
+    """
+    Convert a CLOB price string ("0.999" or ".999") to integer ticks.
+
+    Raises:
+        ValueError: If the string is not a decimal price
+    """
+    whole, _, fraction = price_str.partition(".")
+    fraction = fraction[:PRICE_DECIMALS].ljust(PRICE_DECIMALS, "0")
+    return int(whole or "0") * PRICE_TICKS_PER_UNIT + int(fraction)
+
+
+def decode_message(message: str | bytes):
+    """Decode a WebSocket JSON frame, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
 
 class BookMonitor:
     """Monitor orderbook updates for a specific price level."""
@@ -51,10 +123,26 @@ class BookMonitor:
         self.token_id = token_id
         self.output_file = output_file
         self.ws_url = ws_url or WS_URL
-        self.previous_sizes = {}  # Track previous sizes at each price level and side
+        self.previous_sizes = {"BID": {}, "ASK": {}}  # Previous size per price tick, one table per side
         self.csv_file = None
         self.csv_writer = None
+        self.pending_rows: list[str] = []  # Formatted CSV lines waiting for the next batched write
+        self.formatted_second = -1  # Unix second the cached formatted timestamps belong to
+        self.formatted_timestamps = ("", "")  # Cached (timestamp_iso, timestamp_est)
         self.running = False
+        self.dropped_frames = 0  # Frames dropped from the full queue since monitoring started
+        self.unreported_dropped_frames = 0  # Dropped frames not yet included in a warning
+        self.dropped_frames_logged_at = float("-inf")  # Monotonic time of the last drop warning
+
+        # Subscribe to the book channel with event_type filter; the payload never
+        # changes for this token, so it is encoded once instead of on every reconnect.
+        # Kept as str so websockets sends it as a text frame.
+        self.subscribe_payload = json.dumps({
+            "type": "subscribe",
+            "assets_ids": [token_id],
+            "event_types": ["book"],
+            "custom_feature_enabled": False
+        })
 
     def setup_csv(self):
         """Setup CSV file with headers."""
@@ -77,12 +165,62 @@ class BookMonitor:
                 "event_slug"
             ])
             self.csv_file.flush()
-        print(f"CSV output initialized (append mode): {self.output_file}")
+        logger.info("CSV output initialized (append mode): %s", self.output_file)
+
+    def write_row(self, row: list):
+        """
+        Queue a CSV row, flushing right away if the batch is full.
+
+        Rows hold only numbers, timestamps, prices, token IDs and market
+        hashes, none of which need CSV quoting, so they are joined directly
+        instead of going through csv.writer. The line ending matches
+        csv.writer's default so files can keep being appended to.
+        """
+        self.pending_rows.append(",".join(map(str, row)) + CSV_LINE_TERMINATOR)
+        if len(self.pending_rows) >= CSV_FLUSH_BATCH_SIZE:
+            self.flush_csv()
+
+    def flush_csv(self):
+        """Write all pending rows to the CSV file with a single flush."""
+        if not self.pending_rows or not self.csv_file:
+            return
+        self.csv_file.write("".join(self.pending_rows))
+        self.pending_rows.clear()
+        self.csv_file.flush()
+
+    async def flush_csv_periodically(self):
+        """Flush buffered CSV rows every CSV_FLUSH_INTERVAL_SECONDS."""
+        while self.running:
+            await asyncio.sleep(CSV_FLUSH_INTERVAL_SECONDS)
+            self.flush_csv()
 
     def close_csv(self):
-        """Close CSV file."""
+        """Flush pending rows and close CSV file."""
         if self.csv_file:
+            self.flush_csv()
             self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+
+    def current_timestamps(self) -> tuple[str, str]:
+        """
+        Get the current UTC and EST wall-clock times as CSV strings.
+
+        Both columns have second resolution, so the formatted pair is cached
+        and only rebuilt when the second changes.
+
+        Returns:
+            Tuple of (timestamp_iso, timestamp_est)
+        """
+        now_second = time.time_ns() // 1_000_000_000
+        if now_second != self.formatted_second:
+            now = datetime.fromtimestamp(now_second, tz=dt_timezone.utc)
+            self.formatted_timestamps = (
+                now.strftime(TIMESTAMP_FORMAT),
+                now.astimezone(EST_TIMEZONE).strftime(TIMESTAMP_FORMAT),
+            )
+            self.formatted_second = now_second
+        return self.formatted_timestamps
 
     def process_book_update(self, data: dict):
         """
@@ -101,15 +239,15 @@ class BookMonitor:
         """
         # Ensure the data is a dictionary
         if not isinstance(data, dict):
-            print(f"Unexpected message format: {data}")
+            logger.warning("Unexpected message format: %s", data)
             return
 
         # Extract basic info
         try:
             timestamp_raw = data.get("timestamp")
-            timestamp_ms = int(timestamp_raw) if timestamp_raw is not None else int(datetime.utcnow().timestamp() * 1000)
+            timestamp_ms = int(timestamp_raw) if timestamp_raw is not None else time.time_ns() // 1_000_000
         except (ValueError, TypeError):
-            timestamp_ms = int(datetime.utcnow().timestamp() * 1000)
+            timestamp_ms = time.time_ns() // 1_000_000
         event_slug = data.get("market", "unknown")
         
         # Extract bids and asks arrays
@@ -120,131 +258,188 @@ class BookMonitor:
         best_bid = bids[0]["price"] if bids else "N/A"
         best_ask = asks[0]["price"] if asks else "N/A"
         
-        # Process bids at target price
-        for bid in bids:
+        # Process bids and asks at target price
+        self._process_side(
+            bids, "BID", BID_PRICE_PREFIXES, BID_MIN_TICKS, BID_MAX_TICKS,
+            best_bid, best_ask, timestamp_ms, event_slug,
+        )
+        self._process_side(
+            asks, "ASK", ASK_PRICE_PREFIXES, ASK_MIN_TICKS, ASK_MAX_TICKS,
+            best_bid, best_ask, timestamp_ms, event_slug,
+        )
+
+    def _process_side(
+        self,
+        levels: list,
+        side: str,
+        price_prefixes: tuple[str, ...],
+        min_ticks: int,
+        max_ticks: int,
+        best_bid: str,
+        best_ask: str,
+        timestamp_ms: int,
+        event_slug: str,
+    ):
+        """
+        Log and record levels of one side of the book within a price window.
+
+        Args:
+            levels: Book levels for this side ([{"price": ..., "size": ...}, ...])
+            side: "BID" or "ASK"
+            price_prefixes: Price string prefixes that can fall inside the window
+            min_ticks: Lowest price that is recorded, in ticks (inclusive)
+            max_ticks: Highest price that is recorded, in ticks (inclusive)
+            best_bid: Best bid price string of this update
+            best_ask: Best ask price string of this update
+            timestamp_ms: Book timestamp in milliseconds
+            event_slug: Market identifier of this update
+        """
+        previous_sizes = self.previous_sizes[side]
+        for level in levels:
             try:
-                price = float(bid.get("price", 0))
-                size = float(bid.get("size", 0))
+                # Cheap string check first; only candidate levels get parsed
+                price_str = level.get("price", "")
+                if not isinstance(price_str, str):
+                    price_str = str(price_str)
+                if not price_str.startswith(price_prefixes):
+                    continue
+                try:
+                    price_ticks = price_to_ticks(price_str)
+                except (ValueError, TypeError):
+                    # Malformed price: skip this level, keep processing the rest of the book
+                    logger.warning("Skipping %s level with malformed price: %r", side.lower(), price_str)
+                    continue
                 
-                # Check if this bid is at our target price (>= 0.99)
-                if price < 0.99:
+                # Check if this level is within the target price window
+                if not min_ticks <= price_ticks <= max_ticks:
                     continue
+                price = price_ticks / PRICE_TICKS_PER_UNIT
+                
+                # Only levels that pass the price filter need their size parsed
+                size = float(level.get("size", 0))
                 
-                side = "BID"
-                    
                 # Calculate size change from previous
-                cache_key = f"{price}_{side}"
-                previous_size = self.previous_sizes.get(cache_key, 0.0)
+                previous_size = previous_sizes.get(price_ticks, 0.0)
                 size_change = size - previous_size
-                    
-                    # Only log if this is a new entry or increased size
-                    if size_change > 0:
-                        # Get current timestamp with milliseconds
-                        now = datetime.utcnow()
-                        timestamp_iso = now.strftime("%Y-%m-%d %H:%M:%S")
-                        
-                        # Convert timestamp to EST
-                        est_timezone = timezone("US/Eastern")
-                        timestamp_est = now.astimezone(est_timezone).strftime("%Y-%m-%d %H:%M:%S")
-                        
-                        # Log to console
-                        print(f"\n[{timestamp_iso}] New {side} at {price} (best_bid={best_bid}, best_ask={best_ask})")
-                        print(f"  Size: {size:.2f} (change: +{size_change:.2f})")
-                        print(f"  Token: {self.token_id}")
-                        print(f"  Event Slug: {event_slug}")
-                        print(f"  Best Bid: {best_bid}")
-                        print(f"  Best Ask: {best_ask}")
-                        
-                        # Write to CSV
-                        if self.csv_writer:
-                            self.csv_writer.writerow([
-                                timestamp_ms,
-                                timestamp_iso,
-                                timestamp_est,
-                                price,
-                                size,
-                                size_change,
-                                side,
-                                best_bid,
-                                best_ask,
-                                self.token_id,
-                                event_slug
-                            ])
-                            self.csv_file.flush()
-                    
-                    # Update previous size
-                    self.previous_sizes[cache_key] = size
-                    
-            except (ValueError, KeyError) as e:
-                print(f"Error processing bid: {e}")
-                continue
-        
-        # Process asks at target price
-        for ask in asks:
-            try:
-                price = float(ask.get("price", 0))
-                size = float(ask.get("size", 0))
                 
-                # Check if this ask is at our target price
-                if abs(price - TARGET_PRICE) < PRICE_TOLERANCE:
-                    side = "ASK"
-                    
-                    # Calculate size change from previous
-                    cache_key = f"{price}_{side}"
-                    previous_size = self.previous_sizes.get(cache_key, 0.0)
-                    size_change = size - previous_size
+                # Only log if this is a new entry or increased size
+                if size_change > 0:
+                    # Get current UTC and EST timestamps
+                    timestamp_iso, timestamp_est = self.current_timestamps()
                     
-                    # Only log if this is a new entry or increased size
-                    if size_change > 0:
-                        # Get current timestamp with milliseconds
-                        now = datetime.utcnow()
-                        timestamp_iso = now.strftime("%Y-%m-%d %H:%M:%S")
-                        
-                        # Convert timestamp to EST
-                        est_timezone = timezone("US/Eastern")
-                        timestamp_est = now.astimezone(est_timezone).strftime("%Y-%m-%d %H:%M:%S")
-                        
-                        # Log to console
-                        print(f"\n[{timestamp_iso}] New {side} at {price} (best_bid={best_bid}, best_ask={best_ask})")
-                        print(f"  Size: {size:.2f} (change: +{size_change:.2f})")
-                        print(f"  Token: {self.token_id}")
-                        print(f"  Event Slug: {event_slug}")
-                        print(f"  Best Bid: {best_bid}")
-                        print(f"  Best Ask: {best_ask}")
-                        
-                        # Write to CSV
-                        if self.csv_writer:
-                            self.csv_writer.writerow([
-                                timestamp_ms,
-                                timestamp_iso,
-                                timestamp_est,
-                                price,
-                                size,
-                                size_change,
-                                side,
-                                best_bid,
-                                best_ask,
-                                self.token_id,
-                                event_slug
-                            ])
-                            self.csv_file.flush()
+                    # Log to console
+                    logger.info(
+                        "New %s at %s (best_bid=%s, best_ask=%s) size=%.2f (change: +%.2f) token=%s event_slug=%s",
+                        side, price, best_bid, best_ask, size, size_change, self.token_id, event_slug,
+                    )
                     
-                    # Update previous size
-                    self.previous_sizes[cache_key] = size
+                    # Queue for the next batched CSV write
+                    self.write_row([
+                        timestamp_ms,
+                        timestamp_iso,
+                        timestamp_est,
+                        price,
+                        size,
+                        size_change,
+                        side,
+                        best_bid,
+                        best_ask,
+                        self.token_id,
+                        event_slug
+                    ])
+                
+                # Update previous size
+                previous_sizes[price_ticks] = size
                     
-            except (ValueError, KeyError) as e:
-                print(f"Error processing ask: {e}")
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                logger.error("Error processing %s: %s", side.lower(), e)
                 continue
 
+    def handle_message(self, message: str | bytes):
+        """Decode a WebSocket frame and process it if it is a book update."""
+        try:
+            data = decode_message(message)
+
+            # Check if the message is a list
+            if isinstance(data, list):
+                logger.debug("Received an empty list or unexpected list message. Skipping.")
+                return
+
+            # Check if this is a book update
+            msg_type = data.get("event_type", data.get("type", ""))
+
+            if msg_type == "book":
+                self.process_book_update(data)
+
+        except json.JSONDecodeError:
+            logger.warning("Failed to decode message: %s", message)
+        except Exception as e:
+            logger.error("Error processing message: %s", e)
+
+    async def process_messages(self, queue: asyncio.Queue):
+        """Parse and process frames queued by the WebSocket reader."""
+        while True:
+            message = await queue.get()
+            self.handle_message(message)
+
+    def drain_messages(self, queue: asyncio.Queue):
+        """Process every frame still waiting in the queue."""
+        while not queue.empty():
+            self.handle_message(queue.get_nowait())
+
+    def enqueue_message(self, queue: asyncio.Queue, message: str | bytes):
+        """Queue a frame for the parser, dropping the oldest one if the parser is behind."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Book events are full snapshots, so the newest frame supersedes the oldest
+            queue.get_nowait()
+            queue.put_nowait(message)
+            self.dropped_frames += 1
+            self.unreported_dropped_frames += 1
+            now = time.monotonic()
+            if now - self.dropped_frames_logged_at >= DROPPED_FRAMES_LOG_INTERVAL_SECONDS:
+                logger.warning(
+                    "Message queue full (%d frames); dropped %d oldest frame(s) since the last report",
+                    queue.maxsize, self.unreported_dropped_frames,
+                )
+                self.unreported_dropped_frames = 0
+                self.dropped_frames_logged_at = now
+
+    async def read_frames(self, websocket, queue: asyncio.Queue, debug_enabled: bool = False):
+        """Receive frames from the WebSocket and queue the book events for the parser."""
+        async for message in websocket:
+            if not self.running:
+                break
+
+            if debug_enabled:
+                logger.debug("Received message: %s", message)  # Log the raw message
+
+            # Every book event carries the quoted "book" event type, so frames
+            # without it can be dropped without queueing or decoding them
+            marker = BOOK_EVENT_MARKER_BYTES if isinstance(message, bytes) else BOOK_EVENT_MARKER
+            if marker in message:
+                self.enqueue_message(queue, message)
+
     async def subscribe_and_monitor(self):
         """Connect to WebSocket and monitor book updates."""
-        print(f"Connecting to {self.ws_url}")
-        print(f"Monitoring token: {self.token_id}")
-        print(f"Target price: {TARGET_PRICE}")
-        print("-" * SEPARATOR_LENGTH)
+        logger.info("Connecting to %s", self.ws_url)
+        logger.info("Monitoring token: %s", self.token_id)
+        logger.info("Target price: %s", TARGET_PRICE)
+        logger.info("-" * SEPARATOR_LENGTH)
 
         self.setup_csv()
         self.running = True
+        # Checked once so the raw-frame debug line costs nothing at INFO level
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        flush_task = asyncio.create_task(self.flush_csv_periodically())
+
+        # The reader only receives and queues frames; decoding, matching and CSV
+        # work happen in a separate parser task so they never delay the socket.
+        # The queue and parser outlive reconnects, so no frames are lost there.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+        parser_task = asyncio.create_task(self.process_messages(queue))
+        reconnect_delay = RECONNECT_DELAY_SECONDS
 
         try:
             while self.running:
@@ -252,73 +447,60 @@ class BookMonitor:
                     # Polymarket server sends pings every 30s.
                     # We disable client-side pings (ping_interval=None) to avoid "INVALID OPERATION" errors
                     # but keep ping_timeout to ensure we disconnect if the server stops sending pings.
-                    async with websockets.connect(self.ws_url, ping_interval=None, ping_timeout=60) as websocket:
-                        print("WebSocket connected.")
+                    async with websockets.connect(
+                        self.ws_url,
+                        ping_interval=None,
+                        ping_timeout=60,
+                        compression=WS_COMPRESSION,
+                        max_size=WS_MAX_MESSAGE_BYTES,
+                    ) as websocket:
+                        logger.info("WebSocket connected.")
                         
-                        # Subscribe to the book channel with event_type filter
-                        subscribe_msg = {
-                            "type": "subscribe",
-                            "assets_ids": [self.token_id],
-                            "event_types": ["book"],  # Add event_type filter here
-                            "custom_feature_enabled": False
-                        }
-                        print(f"Subscription message: {json.dumps(subscribe_msg)}")
-                        await websocket.send(json.dumps(subscribe_msg))
-                        print(f"Subscribed to book updates for {self.token_id}")
+                        logger.debug("Subscription message: %s", self.subscribe_payload)
+                        await websocket.send(self.subscribe_payload)
+                        logger.info("Subscribed to book updates for %s", self.token_id)
+                        reconnect_delay = RECONNECT_DELAY_SECONDS
 
                         # Listen for updates
-                        async for message in websocket:
-                            if not self.running:
-                                break
-                                
-                            try:
-                                print(f"Received message: {message}")  # Log the raw message
-                                data = json.loads(message)
-
-                                # Check if the message is a list
-                                if isinstance(data, list):
-                                    print("Received an empty list or unexpected list message. Skipping.")
-                                    continue
-
-                                # Check if this is a book update
-                                msg_type = data.get("event_type", data.get("type", ""))
-
-                                if msg_type in ["book"]:
-                                    self.process_book_update(data)
-
-                            except json.JSONDecodeError:
-                                print(f"Failed to decode message: {message}")
-                            except Exception as e:
-                                print(f"Error processing message: {e}")
+                        await self.read_frames(websocket, queue, debug_enabled)
                 
                 except websockets.exceptions.ConnectionClosedError as e:
-                    print(f"WebSocket connection closed unexpectedly: {e}")
-                    print("Attempting to reconnect in 5 seconds...")
-                    await asyncio.sleep(5)
+                    logger.warning("WebSocket connection closed unexpectedly: %s", e)
                 
                 except websockets.exceptions.WebSocketException as e:
-                    print(f"WebSocket error: {e}")
-                    print("Attempting to reconnect in 5 seconds...")
-                    await asyncio.sleep(5)
+                    logger.error("WebSocket error: %s", e)
                 
                 except Exception as e:
-                    print(f"Unexpected error: {e}")
-                    print("Attempting to reconnect in 5 seconds...")
-                    await asyncio.sleep(5)
+                    logger.error("Unexpected error: %s", e)
+
+                if self.running:
+                    logger.info("Attempting to reconnect in %d seconds...", reconnect_delay)
+                    await asyncio.sleep(reconnect_delay)
+                    reconnect_delay = min(reconnect_delay * 2, MAX_RECONNECT_DELAY_SECONDS)
 
         except asyncio.CancelledError:
-            print("Monitoring cancelled")
+            logger.info("Monitoring cancelled")
 
         finally:
             self.running = False
+            for task in (parser_task, flush_task):
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            # Parse frames the parser had not reached yet so close_csv() writes their rows
+            self.drain_messages(queue)
             self.close_csv()
+            if self.dropped_frames:
+                logger.warning("Dropped %d frames in total because the parser fell behind", self.dropped_frames)
 
     def run(self):
         """Run the monitor."""
         try:
-            asyncio.run(self.subscribe_and_monitor())
+            run_async(self.subscribe_and_monitor())
         except KeyboardInterrupt:
-            print("\nMonitoring stopped by user")
+            logger.info("Monitoring stopped by user")
         finally:
             self.close_csv()
 
@@ -344,6 +526,7 @@ def main():
     )
     
     args = parser.parse_args()
+    setup_logging()
     
     monitor = BookMonitor(args.token_id, args.output, args.ws_url)
     monitor.run()
@@ -9,6 +9,10 @@ from src.monitors.multi_event_monitor import MultiEventMonitor
 from src.monitors.continuous_15min_monitor import ContinuousFifteenMinMonitor
 from src.markets.fifteen_min import MARKET_IDS
 
+# Valid --markets values, computed once for argparse choices and error messages
+_MARKET_CHOICES = tuple(MARKET_IDS)
+_MARKET_CHOICES_STR = ", ".join(_MARKET_CHOICES)
+
 
 def cmd_multi_event(slugs: list[str], output: str, ws_url: str | None, market_events_output: str) -> int:
     """Monitor multiple event slugs simultaneously."""
@@ -33,7 +37,7 @@ def cmd_continuous_15min(markets: list[str], output: str, ws_url: str | None, ma
     invalid_markets = [m for m in markets if m not in MARKET_IDS]
     if invalid_markets:
         print(f"Error: Invalid market selections: {', '.join(invalid_markets)}")
-        print(f"Valid options: {', '.join(MARKET_IDS.keys())}")
+        print(f"Valid options: {_MARKET_CHOICES_STR}")
         return 1
     
     monitor = ContinuousFifteenMinMonitor(
@@ -89,7 +93,7 @@ def main() -> int:
         "--markets",
         nargs="+",
         required=True,
-        choices=list(MARKET_IDS.keys()),
+        choices=_MARKET_CHOICES,
         help="Crypto markets to monitor (e.g., BTC ETH SOL XRP)"
     )
     continuous_parser.add_argument(
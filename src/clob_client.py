@@ -1,24 +1,39 @@
 """CLOB client wrapper for placing Polymarket orders."""
 
+import asyncio
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+from types import MappingProxyType
 from typing import Any, Optional
 
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType
+from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
 from py_clob_client.order_builder.constants import BUY, SELL
 
 from .config import (
+    API_CREDS_CACHE_DIR,
+    API_CREDS_CACHE_ENABLED,
     CHAIN_ID,
     CLOB_HOST,
     FUNDER,
     PRIVATE_KEY,
     SIGNATURE_TYPE,
 )
+from .gamma_client import get_cached_market_for_token, get_order_limits
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
-# Common error reasons for debugging
-ERROR_REASONS = {
+# Maximum number of orders submitted at once by place_limit_orders_batch
+ORDER_BATCH_CONCURRENCY = 8
+
+# Common error reasons for debugging (read-only)
+ERROR_REASONS = MappingProxyType({
+    "INVALID_ORDER_PRICE": "Price outside the open (0, 1) range",
     "INVALID_ORDER_MIN_TICK_SIZE": "Price breaks minimum tick size rules",
     "INVALID_ORDER_MIN_SIZE": "Order size below minimum threshold",
     "INVALID_ORDER_DUPLICATED": "Duplicate order already placed",
@@ -31,11 +46,16 @@ ERROR_REASONS = {
     "ORDER_DELAYED": "Order match delayed due to market conditions",
     "FOK_ORDER_NOT_FILLED_ERROR": "FOK order could not be fully filled",
     "MARKET_NOT_READY": "Market not yet accepting orders",
-}
+})
 
 
 def create_clob_client() -> Optional[ClobClient]:
-    """Create and initialize the CLOB client with API credentials."""
+    """
+    Create and initialize the CLOB client with API credentials.
+
+    Derived credentials are cached on disk (see API_CREDS_CACHE_DIR) so
+    restarts skip re-deriving them.
+    """
     if not PRIVATE_KEY or not FUNDER:
         logger.error("PRIVATE_KEY and FUNDER must be set in .env")
         return None
@@ -48,35 +68,223 @@ def create_clob_client() -> Optional[ClobClient]:
             signature_type=SIGNATURE_TYPE,
             funder=FUNDER,
         )
-        client.set_api_creds(client.create_or_derive_api_creds())
+        creds = _load_cached_api_creds()
+        if creds is None:
+            creds = client.create_or_derive_api_creds()
+            if creds is not None:
+                _save_cached_api_creds(creds)
+        client.set_api_creds(creds)
         return client
     except Exception:
         logger.exception("Failed to create CLOB client")
         return None
 
 
+def _api_creds_cache_path() -> str:
+    """Path of the credentials cache file for the configured wallet and CLOB host."""
+    # Hashed so the file name identifies the wallet without revealing the key
+    digest = hashlib.sha256(f"{PRIVATE_KEY}|{FUNDER}|{CLOB_HOST}".encode()).hexdigest()[:16]
+    return os.path.join(API_CREDS_CACHE_DIR, f"creds-{digest}.json")
+
+
+def _load_cached_api_creds() -> Optional[ApiCreds]:
+    """Load previously derived API credentials, or None if absent or unreadable."""
+    if not API_CREDS_CACHE_ENABLED:
+        return None
+    try:
+        with open(_api_creds_cache_path()) as f:
+            data = json.load(f)
+        creds = ApiCreds(
+            api_key=data["api_key"],
+            api_secret=data["api_secret"],
+            api_passphrase=data["api_passphrase"],
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable API credentials cache")
+        return None
+    logger.info("Using cached API credentials")
+    return creds
+
+
+def _save_cached_api_creds(creds: Optional[ApiCreds]) -> None:
+    """
+    Store derived API credentials in a file only the current user can read.
+
+    The file is written under a temporary name and renamed into place, so a
+    concurrent reader or a crash mid-write never sees a partial file.
+    """
+    if not API_CREDS_CACHE_ENABLED or creds is None:
+        return
+    tmp_path = None
+    try:
+        os.makedirs(API_CREDS_CACHE_DIR, mode=0o700, exist_ok=True)
+        os.chmod(API_CREDS_CACHE_DIR, 0o700)  # makedirs leaves an existing directory's mode alone
+        # mkstemp creates the file with mode 0600
+        fd, tmp_path = tempfile.mkstemp(dir=API_CREDS_CACHE_DIR, prefix=".creds-", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "api_key": creds.api_key,
+                "api_secret": creds.api_secret,
+                "api_passphrase": creds.api_passphrase,
+            }, f)
+        os.replace(tmp_path, _api_creds_cache_path())
+    except OSError:
+        logger.warning("Failed to write API credentials cache")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def invalidate_cached_api_creds() -> None:
+    """Delete the cached API credentials and drop the shared client so both are rebuilt."""
+    try:
+        os.remove(_api_creds_cache_path())
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.warning("Failed to delete API credentials cache")
+    reset_clob_client()
+
+
+_client: Optional[ClobClient] = None
+_client_lock = threading.Lock()
+
+
+def get_clob_client() -> Optional[ClobClient]:
+    """
+    Get the shared CLOB client, creating it on first use.
+
+    API credentials are derived once and the client is reused by every
+    order, so later orders skip the credential round-trip. Failed creation
+    is not cached; the next call tries again.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_clob_client()
+    return _client
+
+
+def reset_clob_client() -> None:
+    """Drop the shared CLOB client so the next call rebuilds it (e.g. after rotating credentials)."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+def validate_order(
+    price: float,
+    size: float,
+    tick_size: Optional[float] = None,
+    min_size: Optional[float] = None,
+) -> Optional[str]:
+    """
+    Check an order against the CLOB rules that can be decided locally.
+
+    Args:
+        price: Limit price
+        size: Order size in shares
+        tick_size: Market tick size (e.g. 0.01 or 0.001); tick check skipped if None
+        min_size: Market minimum order size; minimum check skipped if None
+
+    Returns:
+        The ERROR_REASONS code the CLOB would reject the order with, or None if valid.
+    """
+    if not 0.0 < price < 1.0:  # Also rejects NaN
+        return "INVALID_ORDER_PRICE"
+    if tick_size is not None:
+        ticks = price / tick_size
+        if not math.isclose(ticks, round(ticks), abs_tol=1e-9):
+            return "INVALID_ORDER_MIN_TICK_SIZE"
+    if not math.isfinite(size) or size <= 0 or (min_size is not None and size < min_size):
+        return "INVALID_ORDER_MIN_SIZE"
+    return None
+
+
+def _lookup_order_limits(
+    client: ClobClient,
+    token_id: str,
+    tick_size: Optional[float],
+    min_size: Optional[float],
+) -> tuple[Optional[float], Optional[float]]:
+    """
+    Fill in the tick size and minimum size of a token that the caller did not pass.
+
+    The tick size comes from the CLOB client, which caches it per token and
+    needs it to sign the order anyway; it can change while a market is open.
+    The minimum size is fixed per market and is read from the cached Gamma
+    event. A limit that cannot be found stays None and is left to the CLOB.
+    """
+    if tick_size is None:
+        try:
+            tick_size = float(client.get_tick_size(token_id))
+        except Exception:
+            logger.warning("Could not look up tick size: token_id=%s", token_id)
+    if min_size is None:
+        market = get_cached_market_for_token(token_id)
+        if market is not None:
+            min_size = get_order_limits(market)[1]
+    return tick_size, min_size
+
+
+def _rejected_order(error_msg: str, token_id: str, price: float, size: float) -> dict[str, Any]:
+    """Log a locally rejected order and build the failure response place_limit_order returns."""
+    logger.warning(
+        "Order rejected before submission: errorMsg=%s, reason=%s, token_id=%s, price=%s, size=%s",
+        error_msg,
+        ERROR_REASONS[error_msg],
+        token_id,
+        price,
+        size,
+    )
+    return {"success": False, "errorMsg": error_msg, "orderId": "", "status": ""}
+
+
 def place_limit_order(
     token_id: str,
     price: float,
     size: float = 1.0,
     side: str = "BUY",
+    tick_size: Optional[float] = None,
+    min_size: Optional[float] = None,
 ) -> Optional[dict[str, Any]]:
     """
     Place a limit order on the CLOB.
 
+    Orders that would break price range, tick size or minimum size rules are
+    rejected locally (see validate_order) without posting them. Limits that
+    are not passed in are looked up for the token (see _lookup_order_limits).
+
     Args:
         token_id: CLOB token ID (ERC1155)
         price: Limit price (0.0 - 1.0)
         size: Order size in shares
         side: 'BUY' or 'SELL'
+        tick_size: Market tick size; looked up for the token if None
+        min_size: Market minimum order size; looked up for the token if None
 
     Returns:
         API response dict with success, orderId, errorMsg, status; or None on client error.
     """
-    client = create_clob_client()
+    error_msg = validate_order(price, size, tick_size, min_size)
+    if error_msg:
+        return _rejected_order(error_msg, token_id, price, size)
+
+    client = get_clob_client()
     if client is None:
         return None
 
+    if tick_size is None or min_size is None:
+        tick_size, min_size = _lookup_order_limits(client, token_id, tick_size, min_size)
+        error_msg = validate_order(price, size, tick_size, min_size)
+        if error_msg:
+            return _rejected_order(error_msg, token_id, price, size)
+
     side_const = BUY if side.upper() == "BUY" else SELL
 
     logger.info(
@@ -121,11 +329,55 @@ def place_limit_order(
         logger.debug("Raw API response: %s", resp)
         return resp
 
-    except Exception:
+    except Exception as e:
         logger.exception(
             "Order placement failed: token_id=%s, price=%s, size=%s",
             token_id,
             price,
             size,
         )
+        if getattr(e, "status_code", None) == 401:
+            # Cached credentials were revoked or rotated; derive fresh ones next time
+            logger.warning("CLOB rejected API credentials; clearing cached credentials")
+            invalidate_cached_api_creds()
         return None
+
+
+async def place_limit_order_async(
+    token_id: str,
+    price: float,
+    size: float = 1.0,
+    side: str = "BUY",
+    tick_size: Optional[float] = None,
+    min_size: Optional[float] = None,
+) -> Optional[dict[str, Any]]:
+    """
+    Place a limit order without blocking the event loop.
+
+    Runs place_limit_order in a worker thread; see it for arguments and return value.
+    """
+    return await asyncio.to_thread(place_limit_order, token_id, price, size, side, tick_size, min_size)
+
+
+async def place_limit_orders_batch(orders: list[dict[str, Any]]) -> list[Optional[dict[str, Any]]]:
+    """
+    Place several limit orders concurrently.
+
+    Orders are signed and posted in parallel (at most ORDER_BATCH_CONCURRENCY
+    in flight) over the shared client, so N orders cost roughly one
+    round-trip instead of N.
+
+    Args:
+        orders: Order specs, each with the keyword arguments of place_limit_order
+            (token_id, price, and optionally size, side, tick_size and min_size)
+
+    Returns:
+        One API response (or None on client error) per order, in input order.
+    """
+    semaphore = asyncio.Semaphore(ORDER_BATCH_CONCURRENCY)
+
+    async def place(order: dict[str, Any]) -> Optional[dict[str, Any]]:
+        async with semaphore:
+            return await place_limit_order_async(**order)
+
+    return await asyncio.gather(*(place(order) for order in orders))
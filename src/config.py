@@ -15,6 +15,19 @@ CHAIN_ID = 137
 CLOB_HOST = os.getenv("CLOB_HOST", "https://clob.polymarket.com")
 GAMMA_API = os.getenv("GAMMA_API", "https://gamma-api.polymarket.com").rstrip("/")
 
+# Derived CLOB API credentials cache (set POLYMARKET_CREDS_CACHE=0 to derive on every start)
+API_CREDS_CACHE_ENABLED = os.getenv("POLYMARKET_CREDS_CACHE", "1") != "0"
+API_CREDS_CACHE_DIR = os.path.expanduser(os.getenv("POLYMARKET_CREDS_CACHE_DIR", "~/.cache/polymarket-bot"))
+
+# Gamma event cache (set POLYMARKET_EVENT_CACHE=0 to always hit the API)
+EVENT_CACHE_ENABLED = os.getenv("POLYMARKET_EVENT_CACHE", "1") != "0"
+EVENT_CACHE_TTL_SECONDS = 2.0  # How long an open event's response is reused
+EVENT_CACHE_RESOLVED_TTL_SECONDS = 3600.0  # Resolved events no longer change
+
+# WebSocket connection tuning (book frames are small JSON messages)
+WS_COMPRESSION = None  # Skip per-message deflate; decompressing every frame costs more than it saves
+WS_MAX_MESSAGE_BYTES = 2**22  # Largest accepted message; full-book snapshots stay well below this
+
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -0,0 +1,20 @@
+"""Event loop selection for the async monitors."""
+
+import asyncio
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup (not available on Windows); use the stock loop
+    uvloop = None
+
+
+def run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    if hasattr(uvloop, "run"):  # uvloop >= 0.18
+        return uvloop.run(coro)
+    # Older uvloop has no run(); its policy makes asyncio.run create a uvloop loop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
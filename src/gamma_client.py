@@ -1,34 +1,132 @@
 """Gamma API client for fetching Polymarket events and markets."""
 
+import asyncio
 import json
+import logging
+import threading
 import time
 import requests
-from typing import Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Optional
 
-from .config import GAMMA_API
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder
+    orjson = None
+
+from .config import (
+    EVENT_CACHE_ENABLED,
+    EVENT_CACHE_RESOLVED_TTL_SECONDS,
+    EVENT_CACHE_TTL_SECONDS,
+    GAMMA_API,
+)
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# slug -> (expires_at monotonic time, event dict); only successful fetches are cached
+_event_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_event_cache_lock = threading.Lock()
+
+# Shared session so Gamma requests reuse keep-alive TLS connections instead of
+# opening a new one per call; sized for concurrent fetches from worker threads
+GAMMA_POOL_SIZE = 16
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=GAMMA_POOL_SIZE))
+_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=GAMMA_POOL_SIZE))
+
+
+def _json_loads(raw: bytes | str) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the stdlib exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def fetch_event_by_slug(slug: str) -> Optional[dict[str, Any]]:
     """
     Fetch an event by its slug from the Gamma API.
 
+    Responses are memoized per slug for EVENT_CACHE_TTL_SECONDS, or for
+    EVENT_CACHE_RESOLVED_TTL_SECONDS once every market of the event has
+    resolved, so repeated lookups of the same slug reuse the parsed JSON.
+    The returned dict is shared between callers and must not be mutated,
+    apart from the parsed-field memos the get_* helpers below store on its
+    markets.
+
     Args:
         slug: Event slug (e.g. from polymarket.com/event/{slug})
 
     Returns:
         Event dict with markets, endDate, etc., or None if not found.
     """
+    if not EVENT_CACHE_ENABLED:
+        return _fetch_event_by_slug(slug)
+
+    with _event_cache_lock:
+        cached = _event_cache.get(slug)
+    if cached is not None and cached[0] > time.monotonic():
+        logger.debug("Event cache hit: slug=%s", slug)
+        return cached[1]
+
+    data = _fetch_event_by_slug(slug)
+    if data is not None:
+        _cache_event(slug, data)
+    return data
+
+
+async def fetch_event_by_slug_async(slug: str) -> Optional[dict[str, Any]]:
+    """Fetch an event by slug without blocking the event loop (see fetch_event_by_slug)."""
+    return await asyncio.to_thread(fetch_event_by_slug, slug)
+
+
+def clear_event_cache() -> None:
+    """Drop all cached events so the next lookups hit the API."""
+    with _event_cache_lock:
+        _event_cache.clear()
+
+
+def _cache_event(slug: str, data: dict[str, Any]) -> None:
+    """Store an event in the cache with a TTL based on whether it has resolved."""
+    ttl = EVENT_CACHE_RESOLVED_TTL_SECONDS if _is_event_resolved(data) else EVENT_CACHE_TTL_SECONDS
+    now = time.monotonic()
+    with _event_cache_lock:
+        # Expired entries would only be refetched, so drop them while we're here
+        for stale_slug in [s for s, (expires_at, _) in _event_cache.items() if expires_at <= now]:
+            del _event_cache[stale_slug]
+        _event_cache[slug] = (now + ttl, data)
+
+
+def _is_event_resolved(event: dict[str, Any]) -> bool:
+    """Check if every market of the event has ended with a winning outcome priced in."""
+    markets = event.get("markets") or []
+    if not markets:
+        return False
+    try:
+        return all(
+            is_market_ended(market) and any(p >= 0.99 for p in get_outcome_prices(market))
+            for market in markets
+        )
+    except (ValueError, TypeError):
+        return False
+
+
+def _fetch_event_by_slug(slug: str) -> Optional[dict[str, Any]]:
+    """Fetch an event from the Gamma API, bypassing the cache."""
     url = f"{GAMMA_API}/events/slug/{slug}"
     logger.info("Fetching event: slug=%s", slug)
     try:
         t0 = time.perf_counter()
-        resp = requests.get(url, timeout=30)
+        resp = _session.get(url, timeout=30)
         resp.raise_for_status()
-        logger.debug("Raw API response: %s", resp.text)
-        data = resp.json()
+        if logger.isEnabledFor(logging.DEBUG):  # resp.text decodes the whole body
+            logger.debug("Raw API response: %s", resp.text)
+        data = _json_loads(resp.content)
         elapsed_ms = (time.perf_counter() - t0) * 1000
         markets = data.get("markets") or []
         end_date = data.get("endDate")
@@ -51,20 +149,87 @@ def fetch_event_by_slug(slug: str) -> Optional[dict[str, Any]]:
         return None
 
 
-def get_market_token_ids(market: dict[str, Any]) -> list[str]:
+def fetch_events_by_slugs(slugs: list[str]) -> dict[str, dict[str, Any]]:
     """
-    Extract CLOB token IDs from a market.
+    Fetch several events from the Gamma API in a single request.
 
-    clobTokenIds can be: JSON string '["id1","id2"]', list, or pipe-separated "id1|id2".
+    Fetched events are also stored in the event cache, so subsequent
+    fetch_event_by_slug calls for the same slugs do not hit the network.
+
+    Args:
+        slugs: Event slugs to fetch
+
+    Returns:
+        Dict mapping slug -> event dict. Slugs that were not found (or a
+        failed request) are simply absent; callers can fall back to
+        fetch_event_by_slug for those.
+    """
+    if not slugs:
+        return {}
+
+    url = f"{GAMMA_API}/events"
+    logger.info("Fetching %d events in one request", len(slugs))
+    try:
+        t0 = time.perf_counter()
+        resp = _session.get(url, params={"slug": slugs, "limit": len(slugs)}, timeout=30)
+        resp.raise_for_status()
+        if logger.isEnabledFor(logging.DEBUG):  # resp.text decodes the whole body
+            logger.debug("Raw API response: %s", resp.text)
+        data = _json_loads(resp.content)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+    except Exception:
+        logger.exception("Failed to fetch events: slugs=%s", slugs)
+        return {}
+
+    wanted = set(slugs)
+    events = {
+        event["slug"]: event
+        for event in data
+        if isinstance(event, dict) and event.get("slug") in wanted
+    }
+    logger.info(
+        "Events fetched: requested=%d, found=%d, latency_ms=%.0f",
+        len(slugs),
+        len(events),
+        elapsed_ms,
+    )
+
+    if EVENT_CACHE_ENABLED:
+        for slug, event in events.items():
+            _cache_event(slug, event)
+    return events
+
+
+async def fetch_events_by_slugs_async(slugs: list[str]) -> dict[str, dict[str, Any]]:
+    """Fetch several events without blocking the event loop (see fetch_events_by_slugs)."""
+    return await asyncio.to_thread(fetch_events_by_slugs, slugs)
+
+
+def _memoized(market: dict[str, Any], field: str, memo_key: str, parse: Callable[[Any], list]) -> list:
     """
-    raw = market.get("clobTokenIds")
+    Parse a raw market field once and keep the result on the market dict.
+
+    Gamma encodes list fields as JSON strings, so the parsed list is stored
+    under memo_key and later calls on the same market are a dict lookup.
+    The memo keys start with "_" and are not Gamma fields; drop them before
+    sending a market back out as JSON.
+    """
+    parsed = market.get(memo_key)
+    if parsed is None:
+        parsed = parse(market.get(field))
+        market[memo_key] = parsed
+    return parsed
+
+
+def _parse_token_ids(raw: Any) -> list[str]:
+    """Parse a raw clobTokenIds value."""
     if raw is None:
         return []
     if isinstance(raw, list):
         return [str(x) for x in raw]
     if isinstance(raw, str):
         try:
-            parsed = json.loads(raw)
+            parsed = _json_loads(raw)
             if isinstance(parsed, list):
                 return [str(x) for x in parsed]
         except json.JSONDecodeError:
@@ -73,16 +238,15 @@ def get_market_token_ids(market: dict[str, Any]) -> list[str]:
     return []
 
 
-def get_outcomes(market: dict[str, Any]) -> list[str]:
-    """Extract outcome labels from a market (e.g. ['Up', 'Down'] or ['Yes', 'No'])."""
-    raw = market.get("outcomes")
+def _parse_outcomes(raw: Any) -> list[str]:
+    """Parse a raw outcomes value."""
     if raw is None:
         return []
     if isinstance(raw, list):
         return [str(x) for x in raw]
     if isinstance(raw, str):
         try:
-            parsed = json.loads(raw)
+            parsed = _json_loads(raw)
             if isinstance(parsed, list):
                 return [str(x) for x in parsed]
         except json.JSONDecodeError:
@@ -91,16 +255,15 @@ def get_outcomes(market: dict[str, Any]) -> list[str]:
     return []
 
 
-def get_outcome_prices(market: dict[str, Any]) -> list[float]:
-    """Extract outcome prices from a market (e.g. [1.0, 0.0] when resolved)."""
-    raw = market.get("outcomePrices")
+def _parse_outcome_prices(raw: Any) -> list[float]:
+    """Parse a raw outcomePrices value."""
     if raw is None:
         return []
     if isinstance(raw, list):
         return [float(x) for x in raw]
     if isinstance(raw, str):
         try:
-            parsed = json.loads(raw)
+            parsed = _json_loads(raw)
             if isinstance(parsed, list):
                 return [float(x) for x in parsed]
         except (json.JSONDecodeError, ValueError, TypeError):
@@ -109,6 +272,44 @@ def get_outcome_prices(market: dict[str, Any]) -> list[float]:
     return []
 
 
+def get_market_token_ids(market: dict[str, Any]) -> list[str]:
+    """
+    Extract CLOB token IDs from a market.
+
+    clobTokenIds can be: JSON string '["id1","id2"]', list, or pipe-separated "id1|id2".
+    The parsed list is memoized on the market and must not be mutated.
+    """
+    return _memoized(market, "clobTokenIds", "_tokenIds_parsed", _parse_token_ids)
+
+
+def get_outcomes(market: dict[str, Any]) -> list[str]:
+    """Extract outcome labels from a market (e.g. ['Up', 'Down'] or ['Yes', 'No'])."""
+    return _memoized(market, "outcomes", "_outcomes_parsed", _parse_outcomes)
+
+
+def get_outcome_prices(market: dict[str, Any]) -> list[float]:
+    """Extract outcome prices from a market (e.g. [1.0, 0.0] when resolved)."""
+    return _memoized(market, "outcomePrices", "_outcomePrices_parsed", _parse_outcome_prices)
+
+
+def _direction_index_map(market: dict[str, Any], outcomes: list[str]) -> dict[str, int]:
+    """
+    Get the lowercase direction -> outcome index lookup for a two-outcome market.
+
+    Built once per market and memoized under "_directionIndex_parsed". The
+    first outcome takes precedence when a name matches both sides (e.g.
+    outcomes ["No", "Yes"] map "no" to index 0).
+    """
+    index_map = market.get("_directionIndex_parsed")
+    if index_map is None:
+        first_outcome = outcomes[0].lower()
+        second_outcome = outcomes[1].lower()
+        index_map = {"down": 1, "no": 1, second_outcome: 1}
+        index_map.update({"up": 0, "yes": 0, first_outcome: 0})
+        market["_directionIndex_parsed"] = index_map
+    return index_map
+
+
 def resolve_token_for_direction(market: dict[str, Any], direction: str) -> Optional[str]:
     """
     Map direction (up/down/yes/no) to the corresponding token_id.
@@ -131,15 +332,9 @@ def resolve_token_for_direction(market: dict[str, Any], direction: str) -> Optio
         logger.error("Expected 2 outcomes, got %d: outcomes=%s", len(outcomes), outcomes)
         return None
 
-    first_outcome = outcomes[0].lower()
-    second_outcome = outcomes[1].lower()
-
-    if direction in ("up", "yes") or direction == first_outcome:
-        token_id = token_ids[0]
-        logger.info("Token resolution: direction=%s -> outcomes=%s -> token_id=%s", direction, outcomes, token_id)
-        return token_id
-    if direction in ("down", "no") or direction == second_outcome:
-        token_id = token_ids[1]
+    index = _direction_index_map(market, outcomes).get(direction)
+    if index is not None:
+        token_id = token_ids[index]
         logger.info("Token resolution: direction=%s -> outcomes=%s -> token_id=%s", direction, outcomes, token_id)
         return token_id
 
@@ -175,3 +370,35 @@ def is_market_ended(market: dict[str, Any]) -> bool:
     """Check if the market has ended/resolved."""
     return bool(market.get("ended") or market.get("closed"))
 
+
+def get_cached_market_for_token(token_id: str) -> Optional[dict[str, Any]]:
+    """
+    Find the market a CLOB token belongs to among the cached events.
+
+    Expired entries are searched too: this is only used for fields that are
+    fixed when the market is created, such as orderMinSize. No request is made.
+    """
+    with _event_cache_lock:
+        events = [event for _, event in _event_cache.values()]
+    for event in events:
+        for market in event.get("markets") or []:
+            if token_id in get_market_token_ids(market):
+                return market
+    return None
+
+
+def get_order_limits(market: dict[str, Any]) -> tuple[Optional[float], Optional[float]]:
+    """
+    Get the (tick_size, min_size) order rules from a Gamma market.
+
+    Read from orderPriceMinTickSize and orderMinSize; a missing or unparsable
+    value is returned as None.
+    """
+    limits = []
+    for field in ("orderPriceMinTickSize", "orderMinSize"):
+        try:
+            value = float(market[field])
+        except (KeyError, TypeError, ValueError):
+            value = None
+        limits.append(value if value and value > 0 else None)
+    return limits[0], limits[1]
@@ -1,20 +1,49 @@
 """Structured logging configuration."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 
 from .config import LOG_LEVEL
 
+# Background listener that writes queued records to stdout (set by setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging() -> None:
-    """Configure root logger with consistent format."""
+    """
+    Configure root logger with consistent format.
+
+    Log calls only enqueue the record; a background thread builds the
+    output line and writes it to stdout, so logging never blocks on I/O in
+    the event loop.
+    Calling this more than once is a no-op.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
     level = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(
+        "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
-        stream=sys.stdout,
-    )
+    ))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The queued record only carries the merged message; the full line is built by stream_handler
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(level=level, handlers=[queue_handler])
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Drain records still in the queue when the process exits
+    atexit.register(_listener.stop)
+
     # Reduce noise from third-party libs
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
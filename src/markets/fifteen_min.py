@@ -19,27 +19,48 @@ MarketSelection = Literal["BTC", "ETH", "SOL", "XRP"]
 
 # Time constants
 FIFTEEN_MIN_SECONDS = 15 * 60
+NANOSECONDS_PER_SECOND = 1_000_000_000
 
 
-def get_current_15m_utc() -> int:
+def get_current_15m_utc(now: int | None = None) -> int:
     """
     Get current 15-minute UTC timestamp block.
     
+    Args:
+        now: Optional Unix time in whole seconds (if None, reads the clock)
+        
     Returns:
         Unix timestamp rounded down to the nearest 15-minute interval.
     """
-    now = int(time.time())
-    return (now // FIFTEEN_MIN_SECONDS) * FIFTEEN_MIN_SECONDS
+    if now is None:
+        # Integer clock avoids the float round-trip of int(time.time())
+        now = time.time_ns() // NANOSECONDS_PER_SECOND
+    return now // FIFTEEN_MIN_SECONDS * FIFTEEN_MIN_SECONDS
 
 
-def get_next_15m_utc() -> int:
+def get_next_15m_utc(now: int | None = None) -> int:
     """
     Get the next 15-minute UTC timestamp block.
     
+    Args:
+        now: Optional Unix time in whole seconds (if None, reads the clock)
+        
     Returns:
         Unix timestamp for the next 15-minute interval.
     """
-    return get_current_15m_utc() + FIFTEEN_MIN_SECONDS
+    return get_current_15m_utc(now) + FIFTEEN_MIN_SECONDS
+
+
+def seconds_until_next_15m() -> float:
+    """
+    Get the time left until the next 15-minute boundary.
+    
+    The boundary and the current time come from one time_ns() reading, so
+    the result agrees with get_next_15m_utc() at the boundary.
+    """
+    now_ns = time.time_ns()
+    next_boundary_ns = get_next_15m_utc(now_ns // NANOSECONDS_PER_SECOND) * NANOSECONDS_PER_SECOND
+    return (next_boundary_ns - now_ns) / NANOSECONDS_PER_SECOND
 
 
 def get_market_slug(market_selection: MarketSelection, timestamp: int | None = None) -> str:
@@ -5,7 +5,15 @@ from typing import Optional
 import time
 
 from .multi_event_monitor import MultiEventMonitor
-from ..markets.fifteen_min import get_market_slug, get_current_15m_utc, get_next_15m_utc, MarketSelection, FIFTEEN_MIN_SECONDS
+from ..markets.fifteen_min import (
+    get_market_slug,
+    get_current_15m_utc,
+    seconds_until_next_15m,
+    MarketSelection,
+    FIFTEEN_MIN_SECONDS,
+    NANOSECONDS_PER_SECOND,
+)
+from ..event_loop import run_async
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +26,10 @@ GRACE_PERIOD_SECONDS = 5 * 60
 # How often to check for new markets and remove ended ones
 DEFAULT_CONTINUOUS_CHECK_INTERVAL = 30
 
+# Delay after a 15-minute boundary before checking subscriptions (seconds)
+# Ensures the wake-up lands in the new period rather than just before it
+BOUNDARY_SLACK_SECONDS = 0.5
+
 # Default market status check interval for MultiEventMonitor (seconds)
 # How often to check if markets are still active
 DEFAULT_MARKET_STATUS_CHECK_INTERVAL = 60
@@ -74,16 +86,21 @@ class ContinuousFifteenMinMonitor:
     async def manage_subscriptions(self):
         """Periodically check for new markets to subscribe to and old ones to unsubscribe from."""
         while self.running:
-            await asyncio.sleep(self.check_interval)
+            # Wake up at the next 15-minute boundary if it comes before the regular
+            # check, so the new market is picked up as soon as it starts
+            until_boundary = seconds_until_next_15m() + BOUNDARY_SLACK_SECONDS
+            await asyncio.sleep(min(self.check_interval, until_boundary))
             
             if not self.monitor or not self.monitor.running:
                 continue
             
             logger.debug("Checking for new markets to subscribe and old ones to unsubscribe...")
             
-            current_timestamp = get_current_15m_utc()
-            next_timestamp = get_next_15m_utc()
-            current_time = int(time.time())
+            # One clock reading for the period and the removal checks, so they
+            # cannot disagree when this runs right at a boundary
+            current_time = time.time_ns() // NANOSECONDS_PER_SECOND
+            current_timestamp = get_current_15m_utc(current_time)
+            next_timestamp = current_timestamp + FIFTEEN_MIN_SECONDS
             
             # Collect slugs to add and remove
             slugs_to_add = []
@@ -149,7 +166,7 @@ class ContinuousFifteenMinMonitor:
         
         # Get slugs for current AND next periods
         current_timestamp = get_current_15m_utc()
-        next_timestamp = get_next_15m_utc()
+        next_timestamp = current_timestamp + FIFTEEN_MIN_SECONDS
         
         initial_slugs = []
         
@@ -201,7 +218,7 @@ class ContinuousFifteenMinMonitor:
     def run_sync(self):
         """Run the monitor synchronously (blocking)."""
         try:
-            asyncio.run(self.run())
+            run_async(self.run())
         except KeyboardInterrupt:
             logger.info("Continuous monitor stopped by user")
             self.running = False
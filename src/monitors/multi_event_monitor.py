@@ -2,21 +2,25 @@
 
 import asyncio
 import csv
+import heapq
 import json
 from datetime import datetime
+from operator import itemgetter
 from typing import Any, Optional
 from pytz import timezone as pytz_timezone
 
 import websockets
 
-from ..config import GAMMA_API
+from ..config import GAMMA_API, WS_COMPRESSION, WS_MAX_MESSAGE_BYTES
 from ..gamma_client import (
-    fetch_event_by_slug,
+    fetch_event_by_slug_async,
+    fetch_events_by_slugs_async,
     get_market_token_ids,
     is_market_ended,
     get_winning_token_id,
     get_outcomes,
 )
+from ..event_loop import run_async
 from ..logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -48,6 +52,16 @@ TICKER_CHANGE_WINDOW_MS = 5000  # 5 seconds
 # Separator line length for console output
 SEPARATOR_LENGTH = 60
 
+# CSV rows are flushed to disk periodically instead of after every row
+CSV_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Timezones used for CSV timestamps, resolved once at import time
+UTC_TIMEZONE = pytz_timezone("UTC")
+EST_TIMEZONE = pytz_timezone("US/Eastern")
+
+# Crypto slug prefixes recognised when formatting slugs for the CSV
+SLUG_CRYPTO_PREFIXES = frozenset({"btc", "eth", "sol", "xrp"})
+
 
 class MultiEventMonitor:
     """Monitor orderbook updates for multiple event slugs simultaneously."""
@@ -88,9 +102,13 @@ class MultiEventMonitor:
         self.token_outcomes: dict[str, str] = {}  # token_id -> outcome label (e.g., "Up", "Down")
         self.last_ticker_change: dict[str, int] = {}  # token_id -> timestamp_ms of last ticker change
         
+        # Formatted CSV slugs for slugs that embed their own timestamp (raw slug -> formatted)
+        self.formatted_slugs: dict[str, str] = {}
+        
         # Unified CSV file handle
         self.csv_file = None
         self.csv_writer = None
+        self.csv_dirty = False  # Rows written since the last flush
         
         # WebSocket connection
         self.websocket = None
@@ -128,23 +146,39 @@ class MultiEventMonitor:
             self.csv_file.flush()
         logger.info("Unified CSV output initialized (append mode): %s", self.output_file)
 
+    def flush_csv(self):
+        """Flush rows written since the last flush, if any."""
+        if self.csv_dirty and self.csv_file and not self.csv_file.closed:
+            self.csv_file.flush()
+            self.csv_dirty = False
+
+    async def flush_csv_periodically(self):
+        """Flush the unified CSV every CSV_FLUSH_INTERVAL_SECONDS while running."""
+        while self.running:
+            await asyncio.sleep(CSV_FLUSH_INTERVAL_SECONDS)
+            self.flush_csv()
+
     def close_csv(self):
         """Close CSV file."""
         if self.csv_file:
             self.csv_file.close()
+            self.csv_dirty = False
 
-    async def fetch_token_ids_for_slug(self, slug: str) -> list[str]:
+    async def fetch_token_ids_for_slug(self, slug: str, event: Optional[dict[str, Any]] = None) -> list[str]:
         """
         Get CLOB token IDs for a market slug and track outcomes.
         
         Args:
             slug: Event slug
+            event: Optional pre-fetched event (e.g. from fetch_events_by_slugs_async);
+                fetched from the Gamma API when not provided
             
         Returns:
             List of token IDs for the market
         """
         try:
-            event = fetch_event_by_slug(slug)
+            if event is None:
+                event = await fetch_event_by_slug_async(slug)
             if not event:
                 logger.error("Failed to fetch event for slug: %s", slug)
                 return []
@@ -180,9 +214,12 @@ class MultiEventMonitor:
         """Initialize all markets by fetching their token IDs."""
         logger.info("Initializing %d markets...", len(self.event_slugs))
         
+        # Fetch all events in one round-trip; slugs missing from the batch are fetched individually
+        events = await fetch_events_by_slugs_async(self.event_slugs)
+        
         for slug in self.event_slugs:
             try:
-                token_ids = await self.fetch_token_ids_for_slug(slug)
+                token_ids = await self.fetch_token_ids_for_slug(slug, events.get(slug))
                 if token_ids:
                     self.token_ids[slug] = token_ids
                     self.market_active[slug] = True
@@ -241,6 +278,9 @@ class MultiEventMonitor:
         
         logger.info("Adding %d new markets to monitor", len(new_slugs))
         
+        # Fetch all new events in one round-trip; slugs missing from the batch are fetched individually
+        events = await fetch_events_by_slugs_async([slug for slug in new_slugs if slug not in self.token_ids])
+        
         new_token_ids = []
         for slug in new_slugs:
             # Skip if already monitoring
@@ -250,7 +290,7 @@ class MultiEventMonitor:
             
             try:
                 # Fetch token IDs for new slug
-                token_ids = await self.fetch_token_ids_for_slug(slug)
+                token_ids = await self.fetch_token_ids_for_slug(slug, events.get(slug))
                 if token_ids:
                     self.token_ids[slug] = token_ids
                     self.market_active[slug] = True
@@ -338,6 +378,7 @@ class MultiEventMonitor:
             
             self.token_ids.pop(slug, None)
             self.market_active.pop(slug, None)
+            self.formatted_slugs.pop(slug, None)
             if slug in self.event_slugs:
                 self.event_slugs.remove(slug)
             
@@ -363,12 +404,21 @@ class MultiEventMonitor:
             
             logger.debug("Checking market status for %d markets", len(self.event_slugs))
             
-            for slug in self.event_slugs:
-                if not self.market_active.get(slug, False):
-                    continue  # Skip already inactive markets
-                
+            # Fetch every still-active market concurrently instead of one request at a time
+            active_slugs = [slug for slug in self.event_slugs if self.market_active.get(slug, False)]
+            results = await asyncio.gather(
+                *(fetch_event_by_slug_async(slug) for slug in active_slugs),
+                return_exceptions=True,
+            )
+            
+            for slug, event in zip(active_slugs, results):
+                # remove_markets() may have dropped this slug while the fetches were in flight
+                if slug not in self.token_ids or slug not in self.event_slugs:
+                    logger.debug("Market %s removed during status check, skipping", slug)
+                    continue
                 try:
-                    event = fetch_event_by_slug(slug)
+                    if isinstance(event, Exception):
+                        raise event
                     if not event:
                         logger.warning("Failed to fetch event for status check: %s", slug)
                         continue
@@ -427,13 +477,12 @@ class MultiEventMonitor:
             Tuple of (timestamp_ms, timestamp_iso, timestamp_est)
         """
         # Get UTC time with timezone info
-        now_utc = datetime.now(pytz_timezone("UTC"))
+        now_utc = datetime.now(UTC_TIMEZONE)
         timestamp_ms = int(now_utc.timestamp() * 1000)
         timestamp_iso = now_utc.strftime("%Y-%m-%d %H:%M:%S")
         
         # Convert to EST
-        est_timezone = pytz_timezone("US/Eastern")
-        timestamp_est = now_utc.astimezone(est_timezone).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp_est = now_utc.astimezone(EST_TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
         
         return timestamp_ms, timestamp_iso, timestamp_est
     
@@ -451,69 +500,56 @@ class MultiEventMonitor:
         Returns:
             Formatted slug with EST time, e.g., "btc-15min-up-or-down-16:15"
         """
-        # Convert slug to lowercase for processing
-        slug_lower = slug.lower()
+        # Slugs carrying their own timestamp always format the same way
+        cached = self.formatted_slugs.get(slug)
+        if cached is not None:
+            return cached
         
-        # Crypto name mapping
-        crypto_map = {
-            "btc": "btc",
-            "eth": "eth",
-            "sol": "sol",
-            "xrp": "xrp",
-        }
+        # Known crypto prefixes are all three letters, so one slice + set lookup
+        # replaces scanning every prefix with startswith
+        crypto = slug[:3].lower()
+        if crypto not in SLUG_CRYPTO_PREFIXES:
+            crypto = None
         
-        # Try to extract crypto name and timestamp from slug
-        crypto = None
-        timestamp = None
-        
-        # Check if slug starts with a known crypto
-        for key, value in crypto_map.items():
-            if slug_lower.startswith(key):
-                crypto = value
-                break
-        
-        # Try to extract timestamp from slug (last part after splitting by "-")
-        parts = slug.split("-")
-        if len(parts) >= 2:
-            try:
-                # Try to parse last part as Unix timestamp
-                timestamp = int(parts[-1])
-            except (ValueError, TypeError):
-                pass
+        # Try to extract timestamp from slug (last part after the final "-")
+        prefix, sep, last_part = slug.rpartition("-")
+        timestamp = int(last_part) if sep and last_part.isdecimal() else None
+        cacheable = timestamp is not None
         
         # If no timestamp found in slug, use provided timestamp_ms or current time
         if timestamp is None:
             if timestamp_ms:
                 timestamp = timestamp_ms // 1000  # Convert ms to seconds
             else:
-                timestamp = int(datetime.now(pytz_timezone("UTC")).timestamp())
+                timestamp = int(datetime.now(UTC_TIMEZONE).timestamp())
         
         # Convert timestamp to EST time
-        est_timezone = pytz_timezone("US/Eastern")
         try:
-            dt = datetime.fromtimestamp(timestamp, tz=est_timezone)
+            dt = datetime.fromtimestamp(timestamp, tz=EST_TIMEZONE)
         except (OSError, ValueError):
             # Fallback to UTC if timestamp conversion fails
-            dt = datetime.fromtimestamp(timestamp, tz=pytz_timezone("UTC")).astimezone(est_timezone)
+            dt = datetime.fromtimestamp(timestamp, tz=UTC_TIMEZONE).astimezone(EST_TIMEZONE)
         
         time_str = dt.strftime("%H:%M")
         
         # Format as requested: {crypto}-15min-up-or-down-{HH:MM}
         if crypto:
-            return f"{crypto}-15min-up-or-down-{time_str}"
-        
-        # Fallback: if no crypto found, try to preserve original format with time
-        # Remove timestamp from end if present
-        if parts and parts[-1].isdigit():
-            prefix = "-".join(parts[:-1])
+            formatted = f"{crypto}-15min-up-or-down-{time_str}"
         else:
-            prefix = slug
+            # Fallback: if no crypto found, try to preserve original format with time
+            # Remove timestamp from end if present
+            if not last_part.isdecimal():
+                prefix = slug
+            formatted = f"{prefix}-{time_str}"
         
-        return f"{prefix}-{time_str}"
+        if cacheable:
+            self.formatted_slugs[slug] = formatted
+        return formatted
 
     def _process_order_at_target_price(
         self,
         order: dict[str, Any],
+        price: float,
         side: str,
         asset_id: str,
         slug: str,
@@ -526,6 +562,7 @@ class MultiEventMonitor:
         
         Args:
             order: Order dict with 'price' and 'size' keys
+            price: Order price, already parsed from order['price']
             side: "BID" or "ASK"
             asset_id: Asset/token ID
             slug: Event slug
@@ -534,7 +571,6 @@ class MultiEventMonitor:
             best_ask: Best ask price as string
         """
         try:
-            price = float(order.get("price", 0))
             size = float(order.get("size", 0))
             
             # Check if this order is at our target price (>= 0.99 to catch sweepers and resolution)
@@ -565,9 +601,8 @@ class MultiEventMonitor:
                 ticker_changed_recently = (time_since_ticker_change_ms >= 0 and 
                                           time_since_ticker_change_ms < TICKER_CHANGE_WINDOW_MS)
                 
-                # Format slug to include the hour in 24-hour format for logging
-                now = datetime.utcnow()
-                formatted_slug = f"{slug}-{now.strftime('%H')}:00"
+                # Format slug with EST time using the event timestamp (shared by log line and CSV row)
+                formatted_slug = self._format_slug_with_est_time(slug, event_timestamp_ms)
                 
                 # Log to console with sweeper context
                 sweeper_indicator = " [SWEEPER CANDIDATE]" if (is_winning_token and ticker_changed_recently) else ""
@@ -585,9 +620,6 @@ class MultiEventMonitor:
                     sweeper_indicator,
                 )
                 
-                # Format slug with EST time using the event timestamp
-                formatted_slug = self._format_slug_with_est_time(slug, event_timestamp_ms)
-                
                 # Write to unified CSV
                 if self.csv_writer:
                     try:
@@ -618,7 +650,7 @@ class MultiEventMonitor:
                             str(market_resolved).lower(),
                             error_message
                         ])
-                        self.csv_file.flush()
+                        self.csv_dirty = True
                     except Exception as e:
                         logger.error("Failed to write to CSV: %s", e)
                 else:
@@ -677,33 +709,39 @@ class MultiEventMonitor:
         raw_bids = data.get("bids", [])
         raw_asks = data.get("asks", [])
         
-        # Sort bids descending (highest price first) and asks ascending (lowest price first) before limiting
-        bids = sorted(raw_bids, key=lambda x: float(x["price"]), reverse=True)[:MAX_ORDERBOOK_DEPTH]
-        asks = sorted(raw_asks, key=lambda x: float(x["price"]))[:MAX_ORDERBOOK_DEPTH]
+        # Parse each level's price once; it is reused for selection, matching and display
+        bid_levels = [(float(level["price"]), level) for level in raw_bids]
+        ask_levels = [(float(level["price"]), level) for level in raw_asks]
+        
+        # Select the highest bids and lowest asks (best first) without sorting the whole book
+        depth = max(MAX_ORDERBOOK_DEPTH, MAX_DISPLAY_DEPTH)
+        top_bids = heapq.nlargest(depth, bid_levels, key=itemgetter(0))
+        top_asks = heapq.nsmallest(depth, ask_levels, key=itemgetter(0))
+        bids = top_bids[:MAX_ORDERBOOK_DEPTH]
+        asks = top_asks[:MAX_ORDERBOOK_DEPTH]
         
         # Calculate best_bid and best_ask
-        best_bid = bids[0]["price"] if bids else "N/A"
-        best_ask = asks[0]["price"] if asks else "N/A"
+        best_bid = bids[0][1]["price"] if bids else "N/A"
+        best_ask = asks[0][1]["price"] if asks else "N/A"
         
         # Process bids at target price
-        for bid in bids:
+        for price, bid in bids:
             self._process_order_at_target_price(
-                bid, "BID", asset_id, slug, timestamp_ms, best_bid, best_ask
+                bid, price, "BID", asset_id, slug, timestamp_ms, best_bid, best_ask
             )
         
         # Process asks at target price
-        for ask in asks:
+        for price, ask in asks:
             self._process_order_at_target_price(
-                ask, "ASK", asset_id, slug, timestamp_ms, best_bid, best_ask
+                ask, price, "ASK", asset_id, slug, timestamp_ms, best_bid, best_ask
             )
         
         # Limit the depth of bids and asks for display
-        bids_display = sorted(data.get("bids", []), key=lambda x: float(x["price"]), reverse=True)[:MAX_DISPLAY_DEPTH]
-        asks_display = sorted(data.get("asks", []), key=lambda x: float(x["price"]))[:MAX_DISPLAY_DEPTH]
+        bids_display = [f"price: {bid['price']}, size: {bid['size']}" for _, bid in top_bids[:MAX_DISPLAY_DEPTH]]
+        asks_display = [f"price: {ask['price']}, size: {ask['size']}" for _, ask in top_asks[:MAX_DISPLAY_DEPTH]]
 
         # Print the 5 highest bids and 5 lowest asks as strings in the desired format
-        print(f"Top 5 Bids: {[f'price: {bid['price']}, size: {bid['size']}' for bid in bids_display]}")
-        print(f"Top 5 Asks: {[f'price: {ask['price']}, size: {ask['size']}' for ask in asks_display]}")
+        print(f"Top 5 Bids: {bids_display}\nTop 5 Asks: {asks_display}")
 
     def log_unified_event(
         self,
@@ -788,7 +826,7 @@ class MultiEventMonitor:
                 str(market_resolved).lower(),  # Convert boolean to string
                 error_message if error_message else ""
             ])
-            self.csv_file.flush()
+            self.csv_dirty = True
             logger.debug("Event saved to unified CSV: %s", self.output_file)
     
     def log_market_event(
@@ -898,6 +936,7 @@ class MultiEventMonitor:
         
         # Start market status checking task
         status_task = asyncio.create_task(self.check_market_status())
+        flush_task = asyncio.create_task(self.flush_csv_periodically())
 
         try:
             while self.running:
@@ -916,7 +955,13 @@ class MultiEventMonitor:
                     # Polymarket server sends pings every 30s.
                     # We disable client-side pings (ping_interval=None) to avoid "INVALID OPERATION" errors
                     # but keep ping_timeout to ensure we disconnect if the server stops sending pings.
-                    async with websockets.connect(self.ws_url, ping_interval=None, ping_timeout=60) as websocket:
+                    async with websockets.connect(
+                        self.ws_url,
+                        ping_interval=None,
+                        ping_timeout=60,
+                        compression=WS_COMPRESSION,
+                        max_size=WS_MAX_MESSAGE_BYTES,
+                    ) as websocket:
                         self.websocket = websocket
                         try:
                             logger.info("WebSocket connected.")
@@ -1049,12 +1094,13 @@ class MultiEventMonitor:
             
         finally:
             self.running = False
-            # Cancel status checking task
-            status_task.cancel()
-            try:
-                await status_task
-            except asyncio.CancelledError:
-                pass
+            # Cancel status checking and CSV flush tasks
+            for task in (status_task, flush_task):
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
                 
             self.close_csv()
 
@@ -1070,7 +1116,7 @@ class MultiEventMonitor:
     def run_sync(self):
         """Run the monitor synchronously (blocking)."""
         try:
-            asyncio.run(self.run())
+            run_async(self.run())
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
         finally:
@@ -0,0 +1,180 @@
+"""Tests for order validation and the API credentials cache in src/clob_client.py."""
+
+import hashlib
+import importlib.util
+import math
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+MISSING_DEPS = [
+    name for name in ("py_clob_client", "requests", "dotenv")
+    if importlib.util.find_spec(name) is None
+]
+
+if not MISSING_DEPS:
+    from py_clob_client.clob_types import ApiCreds
+
+    from src import clob_client, gamma_client
+
+TOKEN_ID = "tok-up"
+
+
+@unittest.skipIf(MISSING_DEPS, f"missing dependencies: {', '.join(MISSING_DEPS)}")
+class ValidateOrderTest(unittest.TestCase):
+    def test_valid_order(self):
+        self.assertIsNone(clob_client.validate_order(0.999, 5.0, tick_size=0.001, min_size=5.0))
+
+    def test_off_grid_price(self):
+        self.assertEqual(
+            clob_client.validate_order(0.555, 5.0, tick_size=0.01),
+            "INVALID_ORDER_MIN_TICK_SIZE",
+        )
+
+    def test_size_below_minimum(self):
+        self.assertEqual(
+            clob_client.validate_order(0.5, 4.0, tick_size=0.01, min_size=5.0),
+            "INVALID_ORDER_MIN_SIZE",
+        )
+
+    def test_price_outside_range(self):
+        for price in (0.0, 1.0, 1.5, math.nan):
+            self.assertEqual(clob_client.validate_order(price, 5.0), "INVALID_ORDER_PRICE")
+
+    def test_non_finite_size(self):
+        for size in (math.nan, math.inf, 0.0):
+            self.assertEqual(clob_client.validate_order(0.5, size), "INVALID_ORDER_MIN_SIZE")
+
+
+@unittest.skipIf(MISSING_DEPS, f"missing dependencies: {', '.join(MISSING_DEPS)}")
+class PlaceLimitOrderTest(unittest.TestCase):
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.get_tick_size.return_value = "0.01"
+        self.client.post_order.return_value = {"success": True, "orderId": "0x1", "status": "live"}
+        patcher = mock.patch.object(clob_client, "get_clob_client", return_value=self.client)
+        self.get_clob_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        gamma_client.clear_event_cache()
+        self.addCleanup(gamma_client.clear_event_cache)
+
+    def place_rejected(self, *args, **kwargs):
+        with self.assertLogs(clob_client.logger, "WARNING"):
+            return clob_client.place_limit_order(*args, **kwargs)
+
+    def assert_rejected(self, resp, error_msg):
+        self.assertEqual(resp, {"success": False, "errorMsg": error_msg, "orderId": "", "status": ""})
+        self.client.create_order.assert_not_called()
+        self.client.post_order.assert_not_called()
+
+    def test_rejected_without_client_when_limits_passed(self):
+        resp = self.place_rejected(TOKEN_ID, 0.555, 5.0, tick_size=0.01, min_size=5.0)
+        self.assert_rejected(resp, "INVALID_ORDER_MIN_TICK_SIZE")
+        self.get_clob_client.assert_not_called()
+
+    def test_tick_size_looked_up_from_client(self):
+        resp = self.place_rejected(TOKEN_ID, 0.555, 5.0)
+        self.assert_rejected(resp, "INVALID_ORDER_MIN_TICK_SIZE")
+        self.client.get_tick_size.assert_called_once_with(TOKEN_ID)
+
+    def test_min_size_looked_up_from_cached_market(self):
+        market = {"clobTokenIds": f'["{TOKEN_ID}", "tok-down"]', "orderMinSize": 5}
+        gamma_client._cache_event("btc-updown-15m", {"markets": [market]})
+        resp = self.place_rejected(TOKEN_ID, 0.5, 1.0)
+        self.assert_rejected(resp, "INVALID_ORDER_MIN_SIZE")
+
+    def test_valid_order_is_posted(self):
+        resp = clob_client.place_limit_order(TOKEN_ID, 0.55, 1.0)
+        self.assertTrue(resp["success"])
+        self.client.post_order.assert_called_once()
+
+
+class HttpError(Exception):
+    """Exception carrying an HTTP status code, like py_clob_client's PolyApiException."""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@unittest.skipIf(MISSING_DEPS, f"missing dependencies: {', '.join(MISSING_DEPS)}")
+class ApiCredsCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_dir = os.path.join(tmp.name, "cache")
+        for name, value in (
+            ("API_CREDS_CACHE_DIR", self.cache_dir),
+            ("API_CREDS_CACHE_ENABLED", True),
+            ("PRIVATE_KEY", "0xkey"),
+            ("FUNDER", "0xfunder"),
+            ("CLOB_HOST", "https://clob.example"),
+        ):
+            patcher = mock.patch.object(clob_client, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(clob_client.reset_clob_client)
+        self.creds = ApiCreds(api_key="key", api_secret="secret", api_passphrase="pass")
+
+    def test_cache_path_identifies_wallet_without_the_key(self):
+        digest = hashlib.sha256(b"0xkey|0xfunder|https://clob.example").hexdigest()[:16]
+        path = clob_client._api_creds_cache_path()
+        self.assertEqual(path, os.path.join(self.cache_dir, f"creds-{digest}.json"))
+        self.assertNotIn("0xkey", path)
+        with mock.patch.object(clob_client, "FUNDER", "0xother"):
+            self.assertNotEqual(clob_client._api_creds_cache_path(), path)
+
+    def test_save_and_load_round_trip(self):
+        clob_client._save_cached_api_creds(self.creds)
+        self.assertEqual(clob_client._load_cached_api_creds(), self.creds)
+        self.assertEqual(os.listdir(self.cache_dir), [os.path.basename(clob_client._api_creds_cache_path())])
+
+    def test_save_restricts_file_and_existing_directory(self):
+        os.makedirs(self.cache_dir, mode=0o755)
+        os.chmod(self.cache_dir, 0o755)
+        clob_client._save_cached_api_creds(self.creds)
+        self.assertEqual(stat.S_IMODE(os.stat(self.cache_dir).st_mode), 0o700)
+        self.assertEqual(stat.S_IMODE(os.stat(clob_client._api_creds_cache_path()).st_mode), 0o600)
+
+    def test_none_creds_are_not_saved(self):
+        clob_client._save_cached_api_creds(None)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_malformed_cache_is_ignored(self):
+        os.makedirs(self.cache_dir)
+        with open(clob_client._api_creds_cache_path(), "w") as f:
+            f.write('{"api_key": "key"}')
+        with self.assertLogs(clob_client.logger, "WARNING"):
+            self.assertIsNone(clob_client._load_cached_api_creds())
+
+    def test_client_is_built_when_derived_creds_are_none(self):
+        with mock.patch.object(clob_client, "ClobClient") as client_class:
+            client_class.return_value.create_or_derive_api_creds.return_value = None
+            client = clob_client.create_clob_client()
+        self.assertIs(client, client_class.return_value)
+        client.set_api_creds.assert_called_once_with(None)
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_cached_creds_skip_derivation(self):
+        clob_client._save_cached_api_creds(self.creds)
+        with mock.patch.object(clob_client, "ClobClient") as client_class:
+            client = clob_client.create_clob_client()
+        client.create_or_derive_api_creds.assert_not_called()
+        client.set_api_creds.assert_called_once_with(self.creds)
+
+    def test_unauthorized_order_invalidates_cache(self):
+        clob_client._save_cached_api_creds(self.creds)
+        client = mock.Mock()
+        client.post_order.side_effect = HttpError(401)
+        clob_client._client = client
+        with self.assertLogs(clob_client.logger, "WARNING"):
+            resp = clob_client.place_limit_order(TOKEN_ID, 0.5, 5.0, tick_size=0.01, min_size=5.0)
+        self.assertIsNone(resp)
+        self.assertFalse(os.path.exists(clob_client._api_creds_cache_path()))
+        self.assertIsNone(clob_client._client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Tests for the Gamma event cache in src/gamma_client.py."""
+
+import importlib.util
+import json
+import unittest
+from unittest import mock
+
+MISSING_DEPS = [
+    name for name in ("requests", "dotenv")
+    if importlib.util.find_spec(name) is None
+]
+
+if not MISSING_DEPS:
+    from src import gamma_client
+
+OPEN_EVENT = {"slug": "btc-updown-15m-1700000000", "markets": [{"closed": False, "outcomePrices": '["0.5", "0.5"]'}]}
+RESOLVED_EVENT = {"slug": "btc-updown-15m-1699999100", "markets": [{"closed": True, "outcomePrices": '["1", "0"]'}]}
+
+
+def api_response(data):
+    """Build a stand-in for a successful requests.Response carrying data as JSON."""
+    resp = mock.Mock()
+    resp.content = json.dumps(data).encode()
+    resp.text = resp.content.decode()
+    return resp
+
+
+@unittest.skipIf(MISSING_DEPS, f"missing dependencies: {', '.join(MISSING_DEPS)}")
+class EventCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patchers = [
+            mock.patch.object(gamma_client, "EVENT_CACHE_ENABLED", True),
+            mock.patch.object(gamma_client.time, "monotonic", lambda: self.now),
+            mock.patch.object(gamma_client._session, "get"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.get = gamma_client._session.get
+        gamma_client.clear_event_cache()
+        self.addCleanup(gamma_client.clear_event_cache)
+
+    def fetch(self, event):
+        self.get.return_value = api_response(event)
+        return gamma_client.fetch_event_by_slug(event["slug"])
+
+    def test_hit_within_ttl(self):
+        first = self.fetch(OPEN_EVENT)
+        self.now += gamma_client.EVENT_CACHE_TTL_SECONDS - 0.1
+        self.assertIs(self.fetch(OPEN_EVENT), first)
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_open_event_expires(self):
+        self.fetch(OPEN_EVENT)
+        self.now += gamma_client.EVENT_CACHE_TTL_SECONDS
+        self.fetch(OPEN_EVENT)
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_resolved_event_uses_long_ttl(self):
+        self.fetch(RESOLVED_EVENT)
+        self.now += gamma_client.EVENT_CACHE_RESOLVED_TTL_SECONDS - 1
+        self.fetch(RESOLVED_EVENT)
+        self.assertEqual(self.get.call_count, 1)
+        self.now += 1
+        self.fetch(RESOLVED_EVENT)
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_failures_are_not_cached(self):
+        self.get.side_effect = OSError("connection reset")
+        with self.assertLogs(gamma_client.logger, "ERROR"):
+            self.assertIsNone(gamma_client.fetch_event_by_slug(OPEN_EVENT["slug"]))
+        self.get.side_effect = None
+        self.assertEqual(self.fetch(OPEN_EVENT), OPEN_EVENT)
+        self.assertEqual(self.get.call_count, 2)
+
+    def test_batch_fetch_seeds_cache(self):
+        self.get.return_value = api_response([OPEN_EVENT, RESOLVED_EVENT])
+        events = gamma_client.fetch_events_by_slugs([OPEN_EVENT["slug"], RESOLVED_EVENT["slug"]])
+        self.assertEqual(set(events), {OPEN_EVENT["slug"], RESOLVED_EVENT["slug"]})
+        self.assertIs(gamma_client.fetch_event_by_slug(OPEN_EVENT["slug"]), events[OPEN_EVENT["slug"]])
+        self.assertEqual(self.get.call_count, 1)
+
+    def test_clear_event_cache_forces_refetch(self):
+        self.fetch(RESOLVED_EVENT)
+        gamma_client.clear_event_cache()
+        self.fetch(RESOLVED_EVENT)
+        self.assertEqual(self.get.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Tests for the BookMonitor WebSocket reader in monitor_book_bids.py."""
+
+import asyncio
+import importlib.util
+import json
+import unittest
+
+MISSING_DEPS = [
+    name for name in ("pytz", "websockets", "dotenv")
+    if importlib.util.find_spec(name) is None
+]
+
+if not MISSING_DEPS:
+    import monitor_book_bids
+
+BOOK_FRAME = (
+    '{"event_type": "book", "asset_id": "tok", "market": "0xabc", "timestamp": "1700000000000", '
+    '"bids": [{"price": "0.999", "size": "10"}, {"price": "0.5", "size": "3"}], '
+    '"asks": [{"price": "0.999", "size": "4"}]}'
+)
+
+
+class FakeWebSocket:
+    """Async-iterable stand-in for a websockets connection yielding fixed frames."""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.frames:
+            raise StopAsyncIteration
+        return self.frames.pop(0)
+
+
+@unittest.skipIf(MISSING_DEPS, f"missing dependencies: {', '.join(MISSING_DEPS)}")
+class ReadFramesTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = monitor_book_bids.BookMonitor("tok")
+        self.monitor.running = True
+        self.rows = []
+        self.monitor.write_row = self.rows.append
+
+    def read_and_parse(self, frames):
+        async def run():
+            queue = asyncio.Queue(maxsize=monitor_book_bids.MESSAGE_QUEUE_SIZE)
+            await self.monitor.read_frames(FakeWebSocket(frames), queue)
+            self.monitor.drain_messages(queue)
+
+        asyncio.run(run())
+
+    def test_bytes_book_frame_is_parsed(self):
+        self.read_and_parse([BOOK_FRAME.encode()])
+        self.assertEqual([(row[3], row[6]) for row in self.rows], [(0.999, "BID"), (0.999, "ASK")])
+
+    def test_str_book_frame_is_parsed(self):
+        self.read_and_parse([BOOK_FRAME])
+        self.assertEqual(len(self.rows), 2)
+
+    def test_non_book_frames_are_skipped(self):
+        self.read_and_parse(["PONG", b'{"event_type": "price_change"}'])
+        self.assertEqual(self.rows, [])
+
+
+@unittest.skipIf(MISSING_DEPS, f"missing dependencies: {', '.join(MISSING_DEPS)}")
+class EnqueueMessageTest(unittest.TestCase):
+    def test_dropped_frames_are_counted_and_logged_once_per_interval(self):
+        monitor = monitor_book_bids.BookMonitor("tok")
+
+        async def run():
+            queue = asyncio.Queue(maxsize=2)
+            with self.assertLogs(monitor_book_bids.logger, "WARNING") as logs:
+                for i in range(50):
+                    monitor.enqueue_message(queue, str(i))
+            return [queue.get_nowait() for _ in range(queue.qsize())], logs.output
+
+        frames, output = asyncio.run(run())
+        self.assertEqual(frames, ["48", "49"])
+        self.assertEqual(monitor.dropped_frames, 48)
+        self.assertEqual(len(output), 1)
+        self.assertEqual(monitor.unreported_dropped_frames, 47)
+
+
+def book_frame(bids, asks):
+    """Build a book frame with the given bid and ask price strings, each of size 1."""
+    return json.dumps({
+        "event_type": "book", "asset_id": "tok", "market": "0xabc", "timestamp": "1700000000000",
+        "bids": [{"price": price, "size": "1"} for price in bids],
+        "asks": [{"price": price, "size": "1"} for price in asks],
+    })
+
+
+@unittest.skipIf(MISSING_DEPS, f"missing dependencies: {', '.join(MISSING_DEPS)}")
+class PriceWindowTest(unittest.TestCase):
+    def setUp(self):
+        self.monitor = monitor_book_bids.BookMonitor("tok")
+        self.rows = []
+        self.monitor.write_row = self.rows.append
+
+    def recorded(self, bids=(), asks=()):
+        self.monitor.handle_message(book_frame(bids, asks))
+        return [(row[6], row[3]) for row in self.rows]
+
+    def test_bid_window_is_0_99_to_0_9999(self):
+        self.assertEqual(
+            self.recorded(bids=["0.9899", "0.99", ".995", "0.9999", "1", "1.00"]),
+            [("BID", 0.99), ("BID", 0.995), ("BID", 0.9999)],
+        )
+
+    def test_ask_window_is_exactly_target_price(self):
+        self.assertEqual(
+            self.recorded(asks=["0.9989", "0.999", "0.9991", ".999"]),
+            [("ASK", 0.999)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,9 +33,13 @@ def visualize_bids(csv_file: str, output_prefix: str = "bid_analysis"):
         print(f"Error: File not found: {csv_file}")
         return False
     
-    # Load data
+    # Load only the columns we plot, with numeric columns parsed straight to float64
     try:
-        df = pd.read_csv(csv_file)
+        df = pd.read_csv(
+            csv_file,
+            usecols=["timestamp_iso", "size", "size_change"],
+            dtype={"size": "float64", "size_change": "float64"},
+        )
         print(f"Loaded {len(df)} records from {csv_file}")
     except Exception as e:
         print(f"Error loading CSV: {e}")
@@ -46,8 +50,11 @@ def visualize_bids(csv_file: str, output_prefix: str = "bid_analysis"):
         print("No data to visualize")
         return False
     
-    # Convert timestamp to datetime
-    df['timestamp'] = pd.to_datetime(df['timestamp_iso'])
+    # Convert timestamp to datetime in one vectorized pass; repeated
+    # second-resolution strings are parsed once via the conversion cache.
+    # format='ISO8601' needs pandas >= 2.0; older versions infer the format.
+    iso_format = 'ISO8601' if int(pd.__version__.split('.')[0]) >= 2 else None
+    df['timestamp'] = pd.to_datetime(df['timestamp_iso'], format=iso_format, cache=True)
     
     # Sort by timestamp
     df = df.sort_values('timestamp')
@@ -114,23 +121,29 @@ def visualize_bids(csv_file: str, output_prefix: str = "bid_analysis"):
     print(f"  ✓ Saved: {output_file}")
     plt.close()
     
-    # Print summary statistics
-    print("\n" + "=" * 60)
-    print("SUMMARY STATISTICS")
-    print("=" * 60)
-    print(f"Total bid events: {len(df)}")
-    print(f"Time range: {df['timestamp'].min()} to {df['timestamp'].max()}")
-    print(f"Duration: {df['timestamp'].max() - df['timestamp'].min()}")
-    print(f"\nBid Size:")
-    print(f"  Min: {df['size'].min():.2f}")
-    print(f"  Max: {df['size'].max():.2f}")
-    print(f"  Mean: {df['size'].mean():.2f}")
-    print(f"  Final: {df['size'].iloc[-1]:.2f}")
-    print(f"\nSize Changes:")
-    print(f"  Total increase: {df['size_change'].sum():.2f}")
-    print(f"  Average per event: {df['size_change'].mean():.2f}")
-    print(f"  Largest single increase: {df['size_change'].max():.2f}")
-    print("=" * 60)
+    # Print summary statistics in a single write
+    summary = [
+        "",
+        "=" * 60,
+        "SUMMARY STATISTICS",
+        "=" * 60,
+        f"Total bid events: {len(df)}",
+        f"Time range: {df['timestamp'].min()} to {df['timestamp'].max()}",
+        f"Duration: {df['timestamp'].max() - df['timestamp'].min()}",
+        "",
+        "Bid Size:",
+        f"  Min: {df['size'].min():.2f}",
+        f"  Max: {df['size'].max():.2f}",
+        f"  Mean: {df['size'].mean():.2f}",
+        f"  Final: {df['size'].iloc[-1]:.2f}",
+        "",
+        "Size Changes:",
+        f"  Total increase: {df['size_change'].sum():.2f}",
+        f"  Average per event: {df['size_change'].mean():.2f}",
+        f"  Largest single increase: {df['size_change'].max():.2f}",
+        "=" * 60,
+    ]
+    print("\n".join(summary))
     
     return True
 